@@ -1,9 +1,9 @@
-import json
 import argparse
 from pathlib import Path
 from sec_connector.client import SECClient
 from sec_connector.models import FilingFilter
 from datetime import date
+from itertools import chain
 
 def main():
     """
@@ -27,17 +27,15 @@ def main():
     # load fixture data
     fixtures_dir = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
     try:
-        with open(fixtures_dir / "company_tickers.json") as f:
-            companies = json.load(f)
-        with open(fixtures_dir / "filing_sample.json") as f:
-            filings = json.load(f)
+        # client (filings are streamed straight into the client's index)
+        client = SECClient.from_json_files(
+            fixtures_dir / "company_tickers.json",
+            fixtures_dir / "filing_sample.json",
+        )
     except FileNotFoundError:
         print("Error: Could not find fixture data. Make sure tests/fixtures/ exists.")
         return
 
-    # client
-    client = SECClient(companies, filings)
-
     # company lookup
     try:
         company = client.lookup_company(args.ticker)
@@ -55,23 +53,26 @@ def main():
         limit=args.limit,
     )
 
-    # build filings list
-    filings_list = client.list_filings(company.cik, filters)
-    if not filings_list:
+    # stream filings so nothing past what we print is produced
+    filings_iter = client.iter_filings(company.cik, filters)
+    first = next(filings_iter, None)
+    if first is None:
         print("No filings found for the given filters.")
         return
     
     # print results
     print(f"{'DATE':<12} | {'FORM':<6} | {'ACCESSION #'}")
     print("-" * 45)
-    for f in filings_list:
+    filings_list = []
+    for f in chain((first,), filings_iter):
         print(f"{f.filing_date} | {f.form_type:<6} | {f.accession_number}")
+        if args.download:
+            filings_list.append(f)
 
     # download
     if args.download:
         print("\nDownloading filings...")
-        for f in filings_list:
-            path = client.download_filing(f)
+        for path in client.download_filings(filings_list):
             print(f"Saved: {path}")
         print(f"\n {len(filings_list)} filings saved to 'downloads/'")
 
@@ -1,24 +1,117 @@
 from sec_connector.models import Company, Filing, FilingFilter
+from bisect import bisect_left
+from collections.abc import Hashable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from itertools import islice, repeat
+from operator import itemgetter
 from pathlib import Path
-import json
+import heapq
+import ijson
+import orjson
+
+
+def _sort_by_date(
+    index: dict[Hashable, list[tuple[int, Filing]]]
+) -> tuple[dict[Hashable, list[Filing]], dict[Hashable, list[tuple[int, int]]]]:
+    """
+    Sort each list of (ingest seq, filing) pairs newest first and split it into
+    the filings and a parallel list of (negated date ordinal, seq) keys.
+
+    The sort is stable, so filings sharing a date keep their input order; the keys
+    are ascending, so they can be bisected and merged across lists deterministically.
+    """
+    filings_index = {}
+    keys_index = {}
+    for key, entries in index.items():
+        entries.sort(key=lambda entry: entry[1].filing_date, reverse=True)
+        filings_index[key] = [f for _, f in entries]
+        keys_index[key] = [(-f.filing_date.toordinal(), seq) for seq, f in entries]
+    return filings_index, keys_index
+
+
+def _newest_first(
+    filings: list[Filing],
+    keys: list[tuple[int, int]],
+    date_from: date | None,
+    date_to: date | None,
+) -> Iterator[tuple[tuple[int, int], Filing]]:
+    """Yield (key, filing) for the filings dated within [date_from, date_to], newest first."""
+    # (n,) sorts before every (n, seq), so these bound whole dates
+    lo = bisect_left(keys, (-date_to.toordinal(),)) if date_to else 0
+    hi = bisect_left(keys, (1 - date_from.toordinal(),)) if date_from else len(keys)
+    for i in range(lo, hi):
+        yield keys[i], filings[i]
+
+
 class SECClient:
-    def __init__(self, companies_data: dict[str, dict], filings_data: list[dict]):
+    def __init__(self, companies_data: dict[str, dict], filings_data: Iterable[dict]):
         """
         Initialize the SECClient.
 
         Args:
             companies_data: Mapping of ticker symbol → company info.
-            filings_data: List of raw filing entries (dictionaries).
+            filings_data: Iterable of raw filing entries (dictionaries). It is consumed
+                once while building the index, so a generator works too.
         """
         if not companies_data:
             raise ValueError("companies_data must not be empty")
-        if not filings_data:
-            raise ValueError("filings_data must not be empty")
         
-        self._companies = companies_data
-        self._filings = filings_data
+        # normalize tickers to upper case once, so mixed-case fixture keys still match,
+        # and validate every Company up front so lookups are a plain dict hit
+        self._companies = {k.upper(): v for k, v in companies_data.items()}
+        self._all_companies: dict[str, Company] = {}
+        for key, data in self._companies.items():
+            try:
+                self._all_companies[key] = self._build_company(key, data)
+            except ValueError: # lookup_company reports the problem if this ticker is requested
+                continue
+
+        # parse and index filings by zero-padded CIK once so queries do no parsing work,
+        # plus a secondary index on (CIK, upper-cased form type) so form filters are lookups
+        by_cik: dict[str, list[tuple[int, Filing]]] = {}
+        by_cik_form: dict[tuple[str, str], list[tuple[int, Filing]]] = {}
+        seen = 0
+        for raw in filings_data:
+            seen += 1
+            filing = Filing.from_raw(raw)
+            if filing is None:
+                continue
+            # seen doubles as the ingest sequence number used to break date ties
+            by_cik.setdefault(filing.cik, []).append((seen, filing))
+            by_cik_form.setdefault((filing.cik, filing.form_type.upper()), []).append((seen, filing))
+        if not seen:
+            raise ValueError("filings_data must not be empty")
+
+        # newest first, with a parallel list of bisect keys so list_filings can find
+        # the requested date range instead of checking every filing against it
+        self._filings_by_cik, self._keys_by_cik = _sort_by_date(by_cik)
+        self._filings_by_cik_form, self._keys_by_cik_form = _sort_by_date(by_cik_form)
     
+    @classmethod
+    def from_json_files(cls, companies_path: str | Path, filings_path: str | Path) -> "SECClient":
+        """
+        Build a client from JSON fixture files, streaming the filings array.
+
+        Filings are parsed one at a time and indexed as they arrive, so the full raw
+        JSON list is never held in memory alongside the index.
+
+        Args:
+            companies_path: Path to the ticker → company info JSON object.
+            filings_path: Path to the JSON array of raw filing entries.
+
+        Returns:
+            A SECClient over the loaded data.
+
+        Raises:
+            FileNotFoundError: If either file does not exist.
+            ValueError: If either file contains no data.
+        """
+        with open(companies_path, "rb") as f:
+            companies = orjson.loads(f.read())
+        with open(filings_path, "rb") as f:
+            return cls(companies, ijson.items(f, "item"))
+
     def lookup_company(self, ticker: str) -> Company:
         """
         Look up a company by ticker symbol.
@@ -36,11 +129,22 @@ class SECClient:
             raise ValueError("Ticker must be a non-empty string")
 
         key = ticker.upper()
+        try:
+            return self._all_companies[key]
+        except KeyError:
+            pass
 
+        # not precomputed: either unknown, or its data failed validation; rebuild to raise
         data = self._companies.get(key)
         if data is None:
             raise ValueError(f"Company with ticker '{key}' not found")
+        return self._build_company(key, data)
 
+    @staticmethod
+    def _build_company(key: str, data: dict) -> Company:
+        """Validate raw company data into a Company, raising ValueError if it is unusable."""
+        if not isinstance(data, dict):
+            raise ValueError(f"Company data for {key} is malformed")
         cik = str(data.get("cik", "")).strip()
         if not cik:
             raise ValueError(f"Company data for {key} missing CIK")
@@ -59,47 +163,58 @@ class SECClient:
         Returns:
             List of Filing objects satisfying the filters.
 
+        Raises:
+            ValueError: If CIK is invalid or filters contain invalid dates.
+        """
+        return list(self.iter_filings(cik, filters))
+
+    def iter_filings(self, cik: str, filters: FilingFilter) -> Iterator[Filing]:
+        """
+        Lazily yield filings for a given company CIK, newest first, up to filters.limit.
+
+        Arguments are validated up front; filings are only produced as the caller
+        consumes the iterator, so breaking early skips the remaining work.
+
+        Args:
+            cik: Central Index Key (CIK) of the company.
+            filters: FilingFilter specifying form types, date range, and limit.
+
+        Returns:
+            Iterator of Filing objects satisfying the filters.
+
         Raises:
             ValueError: If CIK is invalid or filters contain invalid dates.
         """
         if not cik or not cik.strip():
             raise ValueError("CIK must be provided")
         cik_padded = cik.zfill(10)
-        filings = []
-        for raw in self._filings:
-            raw_cik = str(raw.get("cik", "")).zfill(10)
-            if raw_cik != cik_padded:
-                continue
-            filing_date_str = raw.get("filing_date")
-            if not filing_date_str: # skip if there is no filing date because a date is required for a Filing object, alternatives would be to make the date None or use a default date
-                continue
-            try:
-                filing_date = date.fromisoformat(filing_date_str)
-            except ValueError: # Skip filings without valid filing_date
-                continue 
-            filing = Filing(
-                cik=raw_cik,
-                company_name=raw.get("company_name", ""),
-                form_type=raw.get("form_type", ""), # could add additional validity checks if we knew all form types
-                filing_date=filing_date, 
-                accession_number=raw.get("accession_number", ""),
-            )
-            filings.append(filing)
-
-        if filters.form_types:
-            allowed = {ft.upper() for ft in filters.form_types}
-            filings = [f for f in filings if f.form_type.upper() in allowed]
-        if filters.date_from:
-            if not isinstance(filters.date_from, date):
-                raise ValueError("date_from must be a valid date object.")
-            filings = [f for f in filings if f.filing_date >= filters.date_from]
-        if filters.date_to:
-            if not isinstance(filters.date_to, date):
-                raise ValueError("date_to must be a valid date object.")
-            filings = [f for f in filings if f.filing_date <= filters.date_to]
-        filings.sort(key=lambda f: f.filing_date, reverse=True)
-        
-        return filings[: filters.limit]
+        allowed = {ft.upper() for ft in filters.form_types} if filters.form_types else None
+        df = filters.date_from
+        dt = filters.date_to
+        if df and not isinstance(df, date):
+            raise ValueError("date_from must be a valid date object.")
+        if dt and not isinstance(dt, date):
+            raise ValueError("date_to must be a valid date object.")
+
+        if allowed is None:
+            keys = [cik_padded]
+            filings_index, keys_index = self._filings_by_cik, self._keys_by_cik
+        else:
+            keys = [(cik_padded, ft) for ft in allowed]
+            filings_index, keys_index = self._filings_by_cik_form, self._keys_by_cik_form
+
+        # one newest-first run per matching index entry, bisected to the date range;
+        # several form types are merged on (date, ingest seq), so ties come out in input
+        # order whatever order the form types were given in, and we stop at limit
+        runs = [
+            _newest_first(filings_index[key], keys_index[key], df, dt)
+            for key in keys
+            if key in filings_index
+        ]
+        if not runs:
+            return iter(())
+        candidates = runs[0] if len(runs) == 1 else heapq.merge(*runs)
+        return map(itemgetter(1), islice(candidates, filters.limit))
 
     def download_filing(self, filing: Filing, out_dir: str | None = None) -> Path:
         """
@@ -120,14 +235,49 @@ class SECClient:
         
         out_dir = Path(out_dir or "downloads")
         out_dir.mkdir(parents=True, exist_ok=True)
+        return self._write_filing(filing, out_dir)
+
+    def download_filings(self, filings: list[Filing], out_dir: str | None = None) -> list[Path]:
+        """
+        Save several filings as JSON, creating the output directory only once.
+
+        Args:
+            filings: Filing objects to save.
+            out_dir: Optional directory path (default: 'downloads').
+
+        Returns:
+            Paths to the saved JSON files, in the same order as filings. Files are
+            written concurrently on a small thread pool; if several filings share an
+            accession number, the last one is saved.
+
+        Raises:
+            ValueError: If any filing is invalid or cannot be written.
+        """
+        for filing in filings:
+            if not filing or not isinstance(filing, Filing):
+                raise ValueError("Invalid Filing object provided for download.")
+
+        out_dir = Path(out_dir or "downloads")
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        # one write per file name so no two threads race on the same path; the last
+        # duplicate wins, as it did when filings were written one after another
+        unique = {filing.accession_number: filing for filing in filings}
+        if len(unique) <= 1:
+            written = {acc: self._write_filing(f, out_dir) for acc, f in unique.items()}
+        else:
+            # file writes release the GIL, so overlap them across a small thread pool
+            with ThreadPoolExecutor(max_workers=min(8, len(unique))) as ex:
+                written = dict(zip(unique, ex.map(self._write_filing, unique.values(), repeat(out_dir))))
+        return [written[filing.accession_number] for filing in filings]
 
-        filename = f"{filing.accession_number}.json"
-        file_path = out_dir / filename
+    def _write_filing(self, filing: Filing, out_dir: Path) -> Path:
+        """Serialize a single filing into an existing directory."""
+        file_path = out_dir / f"{filing.accession_number}.json"
 
         try:
-            with open(file_path, "w") as f:
-                # Use default=str to handle datetime.date
-                json.dump(filing.model_dump(), f, indent=2, default=str)
+            # the serialized bytes are cached on the filing
+            file_path.write_bytes(filing.to_json_bytes())
         except Exception as e:
             raise ValueError(f"Failed to save filing: {e}") from e
 
@@ -1,41 +1,145 @@
-from pydantic import BaseModel, field_validator
-from datetime import date
+import msgspec
+from msgspec.structs import force_setattr
+from datetime import date, datetime, time
+from functools import cached_property, lru_cache
 
-class Company(BaseModel):
+def _validate_fields(obj: msgspec.Struct) -> None:
+    """
+    Check and coerce every field of a Struct against its annotation, in place.
+
+    Calling a Struct constructor directly does no type checking, so models at the
+    input boundary run this from __post_init__. Lax conversion accepts e.g. ISO date
+    strings and numeric strings for ints, and midnight datetimes are narrowed to dates,
+    matching what the earlier Pydantic models allowed.
+
+    Raises:
+        ValueError: If a field cannot be converted to its annotated type.
+    """
+    for field in msgspec.structs.fields(obj):
+        value = getattr(obj, field.name)
+        if isinstance(value, datetime) and field.type in (date, date | None):
+            # msgspec rejects datetime for a date field; Pydantic accepted zero-time ones
+            if value.time() != time(0):
+                raise ValueError(f"Invalid {field.name}: datetimes must have zero time")
+            value = value.date()
+            force_setattr(obj, field.name, value)
+        try:
+            converted = msgspec.convert(value, field.type, strict=False)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"Invalid {field.name}: {e}") from e
+        if converted is not value:
+            force_setattr(obj, field.name, converted)
+
+class Company(msgspec.Struct, frozen=True):
     ticker: str
     cik: str
     name: str
 
-    @field_validator("cik")
-    @classmethod
-    def pad_cik(cls, v: str) -> str:
-        v = v.strip()
+    def __post_init__(self) -> None:
+        _validate_fields(self)
+        v = self.cik.strip()
         if not v.isdigit():
             raise ValueError("CIK must be numeric")
-        return v.zfill(10)
+        force_setattr(self, "cik", v.zfill(10))
 
-class Filing(BaseModel):
+@lru_cache(maxsize=4096)
+def _parse_date(s: str) -> date:
+    # filings from the same day share one date object instead of each allocating their own
+    return date.fromisoformat(s)
+
+# one shared encoder; msgspec encodes Structs and datetime.date natively
+_json_encoder = msgspec.json.Encoder()
+
+class Filing(msgspec.Struct, frozen=True, dict=True):
+    # msgspec Struct: filings are built in bulk at ingest, where a cheap exact-type check
+    # stands in for full validation; dict=True leaves room to cache the serialized JSON
     cik: str
     company_name: str
     form_type: str
     filing_date: date
     accession_number: str #can do validation check on this if requirements are known (like string length, format, etc)
 
-    @field_validator("cik")
+    def __post_init__(self) -> None:
+        # from_raw always passes exact types, so bulk ingest skips the full validation;
+        # anything else handed to the public constructor is checked and coerced
+        if not (
+            type(self.cik) is str
+            and type(self.company_name) is str
+            and type(self.form_type) is str
+            and type(self.filing_date) is date
+            and type(self.accession_number) is str
+        ):
+            _validate_fields(self)
+        # EDGAR data usually ships CIKs already padded, so only rewrite short ones
+        if len(self.cik) < 10:
+            force_setattr(self, "cik", self.cik.zfill(10))
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the filing as indented JSON, caching the result on the instance.
+
+        Returns:
+            UTF-8 encoded JSON with filing_date as an ISO string.
+        """
+        return self._json
+
+    @cached_property
+    def _json(self) -> bytes:
+        return msgspec.json.format(_json_encoder.encode(self), indent=2)
+
     @classmethod
-    def pad_cik(cls, v: str) -> str:
-        return v.zfill(10)
+    def from_raw(cls, raw: dict) -> "Filing | None":
+        """
+        Build a Filing from a raw filing entry.
+
+        Args:
+            raw: Raw filing dictionary as found in the fixture data.
+
+        Returns:
+            A Filing, or None if the entry has a missing or invalid filing_date or a
+            non-string company_name, form_type or accession_number.
+        """
+        filing_date_str = raw.get("filing_date")
+        if not filing_date_str: # skip if there is no filing date because a date is required for a Filing object, alternatives would be to make the date None or use a default date
+            return None
+        # cheap YYYY-MM-DD shape check so obviously malformed dates don't pay for raising
+        if not (
+            isinstance(filing_date_str, str)
+            and len(filing_date_str) == 10
+            and filing_date_str[4] == "-"
+            and filing_date_str[7] == "-"
+        ):
+            return None
+        try: # still needed for well-shaped but impossible dates like 2024-13-45
+            filing_date = _parse_date(filing_date_str)
+        except ValueError: # Skip filings without valid filing_date
+            return None
+        company_name = raw.get("company_name", "")
+        form_type = raw.get("form_type", "") # could add additional validity checks if we knew all form types
+        accession_number = raw.get("accession_number", "")
+        # skip rows with non-string text fields, like bad dates, rather than failing the whole load
+        if not (
+            isinstance(company_name, str)
+            and isinstance(form_type, str)
+            and isinstance(accession_number, str)
+        ):
+            return None
+        return cls(
+            cik=str(raw.get("cik", "")),
+            company_name=company_name,
+            form_type=form_type,
+            filing_date=filing_date,
+            accession_number=accession_number,
+        )
 
     
-class FilingFilter(BaseModel):
+class FilingFilter(msgspec.Struct):
     form_types: list[str] | None = None
     date_from: date | None = None
     date_to: date | None = None
     limit: int = 10
 
-    @field_validator("limit")
-    @classmethod
-    def positive_limit(cls, v: int) -> int:
-        if v <= 0:
-            raise ValueError("limit must be positive")
-        return v
\ No newline at end of file
+    def __post_init__(self) -> None:
+        _validate_fields(self)
+        if self.limit <= 0:
+            raise ValueError("limit must be positive")
\ No newline at end of file
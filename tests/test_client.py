@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
-from datetime import date
+from datetime import date, datetime
+import orjson
 import pytest
 from sec_connector.models import Company, Filing, FilingFilter
 from sec_connector.client import SECClient
@@ -11,8 +12,14 @@ from sec_connector.client import SECClient
 # ---------------------------------------------------------------------
 
 fixtures_dir = Path(__file__).resolve().parent / "fixtures"
-companies = json.load(open(fixtures_dir / "company_tickers.json"))
-filings = json.load(open(fixtures_dir / "filing_sample.json"))
+companies = orjson.loads((fixtures_dir / "company_tickers.json").read_bytes())
+filings = orjson.loads((fixtures_dir / "filing_sample.json").read_bytes())
+
+
+@pytest.fixture(scope="module")
+def client():
+    """One SECClient shared across tests, so the fixture data is indexed only once."""
+    return SECClient(companies, filings)
 
 
 # ---------------------------------------------------------------------
@@ -29,6 +36,10 @@ def test_company_model_rejects_bad_data(): #new
     """Missing required fields or wrong types should raise errors."""
     with pytest.raises(ValueError):
         Company(ticker="", cik="", name="") 
+    with pytest.raises(ValueError):
+        Company(ticker="AAPL", cik=320193, name="Apple Inc.")
+    with pytest.raises(ValueError):
+        Company(ticker="AAPL", cik="320193", name=None)
 
 def test_filing_model_valid():
     f = Filing(
@@ -42,6 +53,62 @@ def test_filing_model_valid():
     assert f.form_type == "10-K"
     assert f.filing_date == date(2024, 10, 1)
 
+def test_filing_model_validates_types():
+    f = Filing(
+        cik="320193",
+        company_name="Apple Inc.",
+        form_type="10-K",
+        filing_date="2024-10-01",
+        accession_number="0000320193-24-000001",
+    )
+    assert f.filing_date == date(2024, 10, 1)
+    with pytest.raises(ValueError):
+        Filing(
+            cik=320193,
+            company_name="Apple Inc.",
+            form_type="10-K",
+            filing_date=date(2024, 10, 1),
+            accession_number="0000320193-24-000001",
+        )
+
+def test_filing_to_json_bytes_is_cached():
+    f = Filing.from_raw(filings[0])
+    data = json.loads(f.to_json_bytes())
+    assert data == filings[0]
+    assert f.to_json_bytes() is f.to_json_bytes()
+    assert f == Filing.from_raw(filings[0])
+
+def test_filing_to_json_bytes_matches_orjson_and_escapes():
+    f = Filing(
+        cik="320193",
+        company_name='Say "Hi"\\ Café\n',
+        form_type="10-K",
+        filing_date=date(2024, 10, 1),
+        accession_number="0000320193-24-000001",
+    )
+    expected = orjson.dumps(
+        {
+            "cik": f.cik,
+            "company_name": f.company_name,
+            "form_type": f.form_type,
+            "filing_date": f.filing_date,
+            "accession_number": f.accession_number,
+        },
+        option=orjson.OPT_INDENT_2,
+    )
+    assert f.to_json_bytes() == expected
+
+def test_filing_from_raw():
+    f = Filing.from_raw(filings[0])
+    assert f.cik == "0000320193"
+    assert f.filing_date == date(2024, 10, 1)
+    assert Filing.from_raw({"cik": "320193", "filing_date": "invalid-date"}) is None
+    assert Filing.from_raw({"cik": "320193"}) is None
+    assert Filing.from_raw({"cik": "320193", "filing_date": "2024-13-45"}) is None
+    assert Filing.from_raw({**filings[0], "form_type": None}) is None
+    assert Filing.from_raw({**filings[0], "company_name": None}) is None
+    assert Filing.from_raw({**filings[0], "accession_number": 1}) is None
+
 
 def test_filing_filter_defaults():
     filt = FilingFilter()
@@ -50,31 +117,54 @@ def test_filing_filter_defaults():
     assert filt.date_to is None
     assert filt.limit == 10
 
+def test_filing_filter_validates_types():
+    with pytest.raises(ValueError):
+        FilingFilter(form_types="10-K")
+    with pytest.raises(ValueError):
+        FilingFilter(date_from="not-a-date")
+    filt = FilingFilter(form_types=("10-K",), date_from="2024-01-01", date_to="2024-12-31", limit="5")
+    assert filt.form_types == ["10-K"]
+    assert filt.date_from == date(2024, 1, 1)
+    assert filt.date_to == date(2024, 12, 31)
+    assert filt.limit == 5
+    filt = FilingFilter(date_from=datetime(2024, 1, 1))
+    assert type(filt.date_from) is date and filt.date_from == date(2024, 1, 1)
+    with pytest.raises(ValueError):
+        FilingFilter(date_from=datetime(2024, 1, 1, 12, 30))
+
+def test_list_filings_with_string_dates(client):
+    cik = client.lookup_company("AAPL").cik
+    results = client.list_filings(cik, FilingFilter(date_from="2024-01-01"))
+    assert [f.filing_date for f in results] == [date(2024, 10, 1), date(2024, 8, 1)]
+
 
 # ---------------------------------------------------------------------
 # TASK 2 — COMPANY LOOKUP TESTS
 # ---------------------------------------------------------------------
 
-def test_lookup_company_valid():
-    client = SECClient(companies, filings)
+def test_lookup_company_valid(client):
     company = client.lookup_company("aapl")
     assert company.name == "Apple Inc."
     assert company.cik == "0000320193"
 
 
-def test_lookup_company_invalid_ticker():
-    client = SECClient(companies, filings)
+def test_lookup_company_invalid_ticker(client):
     with pytest.raises(ValueError):
         client.lookup_company("GOOG")
 
 
-def test_lookup_company_empty_string():
-    client = SECClient(companies, filings)
+def test_lookup_company_empty_string(client):
     with pytest.raises(ValueError):
         client.lookup_company("  ")
 
-def test_lookup_company_cik_is_zero_padded(): #new
-    client = SECClient(companies, filings)
+def test_lookup_company_mixed_case_keys():
+    client = SECClient({"brk.b": {"cik": "1067983", "name": "Berkshire Hathaway"}}, filings)
+    assert client.lookup_company("BRK.B").cik == "0001067983"
+
+def test_lookup_company_is_cached(client):
+    assert client.lookup_company("AAPL") is client.lookup_company("aapl")
+
+def test_lookup_company_cik_is_zero_padded(client): #new
     company = client.lookup_company("MSFT")
     assert company.cik == "0000789019"
 
@@ -83,8 +173,7 @@ def test_lookup_company_cik_is_zero_padded(): #new
 # TASK 3 — FILINGS LIST & FILTER TESTS
 # ---------------------------------------------------------------------
 
-def test_no_filters_returns_all_filings_limited(): #new
-    client = SECClient(companies, filings)
+def test_no_filters_returns_all_filings_limited(client): #new
     cik = client.lookup_company("AAPL").cik
     results = client.list_filings(cik, FilingFilter())
     assert len(results) <= 10  # limit defaults to 10
@@ -94,37 +183,98 @@ def test_no_filters_returns_all_filings_limited(): #new
     assert dates == sorted(dates, reverse=True)
 
 
-def test_form_type_filter_only_10K():
-    client = SECClient(companies, filings)
+def test_form_type_filter_only_10K(client):
     cik = client.lookup_company("AAPL").cik
     results = client.list_filings(cik, FilingFilter(form_types=["10-K"]))
     assert all(f.form_type.upper() == "10-K" for f in results)
 
 
-def test_date_range_filter():
-    client = SECClient(companies, filings)
+def test_multiple_form_types_merged_newest_first(client):
+    cik = client.lookup_company("AAPL").cik
+    results = client.list_filings(cik, FilingFilter(form_types=["8-k", "10-K"]))
+    assert [(f.form_type, f.filing_date) for f in results] == [
+        ("10-K", date(2024, 10, 1)),
+        ("8-K", date(2023, 12, 15)),
+    ]
+
+
+def test_date_range_filter(client):
     cik = client.lookup_company("AAPL").cik
     filters = FilingFilter(date_from=date(2024, 1, 1))
     results = client.list_filings(cik, filters)
     assert all(f.filing_date >= date(2024, 1, 1) for f in results)
 
 
-def test_results_sorted_newest_first():
-    client = SECClient(companies, filings)
+def test_date_range_filter_inclusive_bounds(client):
+    cik = client.lookup_company("AAPL").cik
+    filters = FilingFilter(date_from=date(2023, 12, 15), date_to=date(2024, 8, 1))
+    results = client.list_filings(cik, filters)
+    assert [f.filing_date for f in results] == [date(2024, 8, 1), date(2023, 12, 15)]
+
+
+def _same_day_filings():
+    return [
+        {"cik": "320193", "company_name": "Apple Inc.", "form_type": "10-K",
+         "filing_date": "2024-01-01", "accession_number": "first"},
+        {"cik": "320193", "company_name": "Apple Inc.", "form_type": "8-K",
+         "filing_date": "2024-01-01", "accession_number": "second"},
+    ]
+
+
+def test_same_date_filings_keep_input_order():
+    client = SECClient(companies, _same_day_filings())
+    cik = client.lookup_company("AAPL").cik
+    results = client.list_filings(cik, FilingFilter())
+    assert [f.accession_number for f in results] == ["first", "second"]
+    results = client.list_filings(cik, FilingFilter(limit=1))
+    assert [f.accession_number for f in results] == ["first"]
+
+
+def test_same_date_ties_ignore_form_type_order():
+    client = SECClient(companies, _same_day_filings())
+    cik = client.lookup_company("AAPL").cik
+    for form_types in (["8-K", "10-K"], ["10-K", "8-K"]):
+        results = client.list_filings(cik, FilingFilter(form_types=form_types))
+        assert [f.accession_number for f in results] == ["first", "second"]
+        results = client.list_filings(cik, FilingFilter(form_types=form_types, limit=1))
+        assert [f.accession_number for f in results] == ["first"]
+
+
+def test_results_sorted_newest_first(client):
     cik = client.lookup_company("AAPL").cik
     results = client.list_filings(cik, FilingFilter())
     dates = [f.filing_date for f in results]
     assert dates == sorted(dates, reverse=True)
 
 
-def test_limit_respected():
-    client = SECClient(companies, filings)
+def test_limit_respected(client):
     cik = client.lookup_company("AAPL").cik
     filters = FilingFilter(limit=1)
     results = client.list_filings(cik, filters)
     assert len(results) == 1
 
 
+def test_iter_filings_is_lazy_and_matches_list(client):
+    cik = client.lookup_company("AAPL").cik
+    it = client.iter_filings(cik, FilingFilter())
+    assert next(it).filing_date == date(2024, 10, 1)
+    assert [next(it)] + list(it) == client.list_filings(cik, FilingFilter())[1:]
+
+
+def test_iter_filings_validates_eagerly(client):
+    with pytest.raises(ValueError):
+        client.iter_filings("", FilingFilter())
+
+
+def test_corrupt_row_for_other_cik_does_not_break_client():
+    corrupt = dict(filings[3], form_type=None)  # an MSFT row
+    client = SECClient(companies, filings + [corrupt])
+    aapl = client.list_filings(client.lookup_company("AAPL").cik, FilingFilter())
+    assert len(aapl) == 3
+    msft = client.list_filings(client.lookup_company("MSFT").cik, FilingFilter())
+    assert [f.accession_number for f in msft] == ["0000789019-24-000001"]
+
+
 def test_missing_or_invalid_filing_date_skipped():
     # Create a copy of filings with one invalid and one missing date
     broken_filings = filings + [
@@ -152,8 +302,7 @@ def test_missing_or_invalid_filing_date_skipped():
 # TASK 4 — DOWNLOAD CAPABILITY TEST
 # ---------------------------------------------------------------------
 
-def test_download_filing_creates_valid_json(tmp_path):
-    client = SECClient(companies, filings)
+def test_download_filing_creates_valid_json(client, tmp_path):
     cik = client.lookup_company("AAPL").cik
     filing = client.list_filings(cik, FilingFilter(limit=1))[0]
 
@@ -170,16 +319,78 @@ def test_download_filing_creates_valid_json(tmp_path):
     assert isinstance(data["filing_date"], str)  # Should be ISO string
 
 
+def test_download_filings_batch(client, tmp_path):
+    cik = client.lookup_company("AAPL").cik
+    results = client.list_filings(cik, FilingFilter())
+    out_dir = tmp_path / "nested" / "downloads"
+
+    paths = client.download_filings(results, out_dir=out_dir)
+    assert [p.name for p in paths] == [f"{f.accession_number}.json" for f in results]
+    for path, filing in zip(paths, results):
+        data = json.loads(path.read_text())
+        assert data["accession_number"] == filing.accession_number
+        assert data["filing_date"] == filing.filing_date.isoformat()
+
+
+def test_download_filings_duplicate_accession_last_wins(client, tmp_path):
+    cik = client.lookup_company("AAPL").cik
+    first, second = client.list_filings(cik, FilingFilter(limit=2))
+    dup = Filing(
+        cik=second.cik,
+        company_name=second.company_name,
+        form_type=second.form_type,
+        filing_date=second.filing_date,
+        accession_number=first.accession_number,
+    )
+    paths = client.download_filings([first, second, dup], out_dir=tmp_path)
+    assert paths[0] == paths[2]
+    data = json.loads(paths[0].read_text())
+    assert data["form_type"] == dup.form_type
+
+
+def test_download_filings_rejects_invalid_filing(client, tmp_path):
+    with pytest.raises(ValueError):
+        client.download_filings([None], out_dir=tmp_path)
+
+
 # ---------------------------------------------------------------------
 # TASK 5 — EDGE CASES & INPUT VALIDATION TESTS
 # ---------------------------------------------------------------------
 
-def test_list_filings_invalid_cik():
-    client = SECClient(companies, filings)
+def test_from_json_files_streams_filings(client):
+    streamed_client = SECClient.from_json_files(
+        fixtures_dir / "company_tickers.json", fixtures_dir / "filing_sample.json"
+    )
+    cik = streamed_client.lookup_company("AAPL").cik
+    streamed = streamed_client.list_filings(cik, FilingFilter())
+    expected = client.list_filings(cik, FilingFilter())
+    assert streamed == expected
+
+
+def test_client_rejects_empty_filings_iterable():
+    with pytest.raises(ValueError):
+        SECClient(companies, iter([]))
+
+
+def test_list_filings_invalid_cik(client):
     with pytest.raises(ValueError):
         client.list_filings("", FilingFilter())
 
 
+def test_lookup_company_non_numeric_cik():
+    client = SECClient({"BAD": {"cik": "abc", "name": "Bad Co"}, **companies}, filings)
+    assert client.lookup_company("AAPL").cik == "0000320193"
+    with pytest.raises(ValueError):
+        client.lookup_company("BAD")
+
+
+def test_lookup_company_malformed_entry_is_reported_lazily():
+    client = SECClient({"BAD": None, **companies}, filings)
+    assert client.lookup_company("AAPL").cik == "0000320193"
+    with pytest.raises(ValueError):
+        client.lookup_company("BAD")
+
+
 def test_lookup_company_missing_cik_field():
     bad_companies = {"FAKE": {"name": "Fake Co"}}
     client = SECClient(bad_companies, filings)
@@ -192,9 +403,8 @@ def test_filing_filter_zero_limit():
         FilingFilter(limit=0)
 
 
-def test_filing_filter_invalid_dates():
+def test_filing_filter_invalid_dates(client):
     """If an invalid date range is passed, no crash should occur (graceful handling)."""
-    client = SECClient(companies, filings)
     cik = client.lookup_company("AAPL").cik
     # Using future date range that yields no results
     filters = FilingFilter(date_from=date(2030, 1, 1), date_to=date(2030, 12, 31))